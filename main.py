@@ -1,26 +1,84 @@
 # main.py
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+import orjson
 from typing import Optional, Dict
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
+import asyncio
+import time
 import httpx
 
+import pf_gear
 from pf_gear import fetch_gear_for_date, debug_meetings, debug_form_csv
 
-app = FastAPI(title="PF Gear Changes", version="1.0.0")
+# --- Shared PF HTTP client (one pool for the whole app; keep-alive avoids
+#     a TCP+TLS handshake per PF call) ---
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # http2: the per-race fan-out multiplexes over one TCP+TLS connection
+    # (httpx falls back to h1 cleanly if PF doesn't negotiate it); gzip cuts
+    # the CSV/JSON bodies on the wire and httpx decompresses transparently.
+    client = httpx.AsyncClient(
+        timeout=30.0,
+        http2=True,
+        headers={"accept-encoding": "gzip, deflate"},
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30),
+    )
+    app.state.http = client
+    pf_gear.HTTP = client
+    purger = asyncio.create_task(_purge_cache_loop())
+    try:
+        yield
+    finally:
+        purger.cancel()
+        pf_gear.HTTP = None
+        await client.aclose()
+
+# orjson serialization skips jsonable_encoder on every response — the gear
+# payloads are plain dicts we built ourselves, so there's nothing to re-encode.
+app = FastAPI(title="PF Gear Changes", version="1.0.0", lifespan=lifespan,
+              default_response_class=ORJSONResponse)
 
 # --- Timezone helpers ---
 MEL = ZoneInfo("Australia/Melbourne")
 
+@lru_cache(maxsize=1)
+def _mel_date_for_second(now_s: int) -> str:
+    # Keyed by the wall-clock second: every request within the same second
+    # reuses the formatted date instead of re-running datetime.now + formatting.
+    dt = datetime.now(MEL)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
 def today_mel_str() -> str:
     try:
-        return datetime.now(MEL).strftime("%Y-%m-%d")
+        return _mel_date_for_second(int(time.time()))
     except Exception:
         # Fallback if zoneinfo not available
         return datetime.utcnow().strftime("%Y-%m-%d")
 
-# --- Simple in-memory cache keyed by 'YYYY-MM-DD' ---
-GEAR_CACHE: Dict[str, dict] = {}
+# --- In-memory TTL cache keyed by 'YYYY-MM-DD' ---
+# Value is (monotonic timestamp, orjson-encoded bytes): the payload is immutable
+# once computed, so caching serialized bytes turns a hit into a dict lookup plus
+# a socket write. Entries are fresh for CACHE_TTL and purged entirely after
+# CACHE_MAX_AGE so the dict can't grow without bound.
+CACHE_TTL = 26 * 3600
+CACHE_MAX_AGE = 48 * 3600
+GEAR_CACHE: Dict[str, tuple] = {}
+# Per-date locks so a burst of concurrent requests triggers one upstream fetch.
+GEAR_LOCKS: Dict[str, asyncio.Lock] = {}
+
+async def _purge_cache_loop():
+    while True:
+        await asyncio.sleep(3600)
+        now = time.monotonic()
+        stale = [d for d, (ts, _) in GEAR_CACHE.items() if now - ts > CACHE_MAX_AGE]
+        for d in stale:
+            GEAR_CACHE.pop(d, None)
+            GEAR_LOCKS.pop(d, None)
 
 @app.get("/healthz")
 async def healthz():
@@ -50,16 +108,32 @@ async def gear_daily(
     """
     d = date or today_mel_str()
 
-    if not warm and d in GEAR_CACHE:
-        return GEAR_CACHE[d]
+    def _fresh() -> Optional[Response]:
+        hit = GEAR_CACHE.get(d)
+        if hit and time.monotonic() - hit[0] < CACHE_TTL:
+            return Response(content=hit[1], media_type="application/json")
+        return None
 
-    try:
-        data = await fetch_gear_for_date(d)
-    except httpx.HTTPStatusError as e:
-        raise HTTPException(status_code=502, detail=f"PF call failed: {e}") from e
+    if not warm:
+        cached = _fresh()
+        if cached is not None:
+            return cached
+
+    async with GEAR_LOCKS.setdefault(d, asyncio.Lock()):
+        # Another request may have filled the cache while we waited.
+        if not warm:
+            cached = _fresh()
+            if cached is not None:
+                return cached
+
+        try:
+            data = await fetch_gear_for_date(d)
+        except httpx.HTTPStatusError as e:
+            raise HTTPException(status_code=502, detail=f"PF call failed: {e}") from e
 
-    GEAR_CACHE[d] = data
-    return data
+        body = orjson.dumps(data)
+        GEAR_CACHE[d] = (time.monotonic(), body)
+        return Response(content=body, media_type="application/json")
 
 @app.get("/gear/today")
 async def gear_today(
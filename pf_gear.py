@@ -1,15 +1,46 @@
 # pf_gear.py — Gear Changes per meeting/race/runner for a given date (AUS/MEL)
+import asyncio
 import os
 import re
 import csv
 import io
 import unicodedata
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Set, Tuple
 import httpx
 from datetime import datetime
 
 PF_API_KEY = os.getenv("PF_API_KEY")
 
+# Shared AsyncClient — created by the FastAPI lifespan in main.py and reused for
+# every PF call so we keep one connection pool (no per-request TCP/TLS handshake).
+HTTP: Optional[httpx.AsyncClient] = None
+
+def _client() -> httpx.AsyncClient:
+    if HTTP is None:
+        raise RuntimeError("shared httpx.AsyncClient not initialised (app lifespan not started)")
+    return HTTP
+
+# Bound on total in-flight PF requests, enforced where the requests are made so
+# every gather() fan-out shares it. Retries cover transient 429/5xx responses.
+_PF_SEM = asyncio.Semaphore(16)
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+_RETRY_ATTEMPTS = 3
+
+async def _pf_get(url: str, headers: Dict[str, str], params: Dict[str, Any]) -> httpx.Response:
+    """GET with the shared client, bounded by _PF_SEM, with capped exponential backoff."""
+    client = _client()
+    r: httpx.Response
+    for attempt in range(_RETRY_ATTEMPTS):
+        async with _PF_SEM:
+            r = await client.get(url, headers=headers, params=params)
+        if r.status_code in _RETRY_STATUS and attempt < _RETRY_ATTEMPTS - 1:
+            await asyncio.sleep(0.5 * (2 ** attempt))
+            continue
+        break
+    return r
+
 # PF endpoints
 PF_FORM_CSV_URL     = "https://api.puntingform.com.au/v2/form/form/csv"
 PF_MEETING_CSV_URL  = "https://api.puntingform.com.au/v2/form/meeting/csv"
@@ -18,7 +49,13 @@ PF_UPD_COND_URL     = "https://api.puntingform.com.au/v2/Updates/Conditions"
 
 # ---------------- helpers ----------------
 
-import re  # ensure this import exists at top
+# Precompiled patterns: _snakify runs on every column of every CSV row, so skip
+# the re module's keyed pattern-cache lookup on each call.
+_SNAKIFY_RE    = re.compile(r"[^a-z0-9]+")
+_WS_RE         = re.compile(r"\s+")
+_ISO_PREFIX_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})[T ]")
+_YMD_RE        = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DMY_RE        = re.compile(r"(\d{2})-(\d{2})-(\d{4})")
 
 def _snakify(s):
     """Safe snake-case: tolerate None/objects, collapse non-alnum to underscores."""
@@ -27,7 +64,7 @@ def _snakify(s):
     if not isinstance(s, str):
         s = str(s)
     s = s.strip().lower()
-    return re.sub(r"[^a-z0-9]+", "_", s).strip("_")
+    return _SNAKIFY_RE.sub("_", s).strip("_")
 
 def _canonise(d):
     """Normalise dict keys (snake-case) and drop null/empty keys."""
@@ -52,8 +89,8 @@ def _norm_name(name: Optional[str]) -> Optional[str]:
     s = unicodedata.normalize("NFKD", str(name))
     s = "".join(ch for ch in s if not unicodedata.combining(ch))
     s = s.lower()
-    s = re.sub(r"[^a-z0-9]+", " ", s).strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _SNAKIFY_RE.sub(" ", s).strip()
+    s = _WS_RE.sub(" ", s)
     return s or None
 
 def _canonise(d: Dict[str, Any]) -> Dict[str, Any]:
@@ -67,12 +104,12 @@ def _yyyy_mm_dd(date_str: str) -> Optional[str]:
     if not date_str:
         return None
     s = str(date_str).strip()
-    m = re.match(r"^(\d{4}-\d{2}-\d{2})[T ]", s)
+    m = _ISO_PREFIX_RE.match(s)
     if m:
         return m.group(1)
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", s):
+    if _YMD_RE.fullmatch(s):
         return s
-    m = re.fullmatch(r"(\d{2})-(\d{2})-(\d{4})", s)
+    m = _DMY_RE.fullmatch(s)
     if m:
         d, mth, y = m.groups()
         return f"{y}-{mth}-{d}"
@@ -88,6 +125,18 @@ RACE_NO_KEYS    = {"race_number", "racenumber", "race_no", "raceno", "race"}
 GEAR_KEYS       = {"gearchanges", "gear_changes", "gear_change", "gear", "gear_desc", "gear_description"}
 SCRATCH_KEYS    = {"scratched", "is_scratched", "scratch"}
 
+# Every known alias → the canonical field name, merged into one dict so header
+# resolution is a single O(1) lookup per column instead of probing each alias
+# set in turn. Gear deliberately maps only the top-level "gearchanges" column —
+# the Forms[n].GearChanges history must stay excluded.
+CANONICAL_KEY_MAP: Dict[str, str] = {
+    **{k: "runner_number" for k in RUNNER_NUM_KEYS},
+    **{k: "horse_name" for k in HORSE_NAME_KEYS},
+    **{k: "scratched" for k in SCRATCH_KEYS},
+    "gearchanges": "gear_change",
+    "runner_id": "runner_id",
+}
+
 def _get_first(d: Dict[str, Any], keys: Set[str]) -> Optional[Any]:
     for k in keys:
         if k in d and d[k] not in ("", None):
@@ -137,60 +186,78 @@ def _first_track_name(rows: List[Dict[str, Any]]) -> Optional[str]:
 
 # ---------------- HTTP (header+param fallbacks) ----------------
 
+# Which auth style PF accepted last ("header" or "param"). Learned on the first
+# successful call so we stop paying a doomed 401 round-trip on every request.
+_AUTH_STYLE: Optional[str] = None
+_AUTH_LOCK = asyncio.Lock()
+
+def _auth_attempts(accept: str, key: str, params: Dict[str, Any]) -> List[Tuple[str, Dict[str, str], Dict[str, Any]]]:
+    header = ("header", {"accept": accept, "X-Api-Key": key}, params)
+    param  = ("param",  {"accept": accept}, {**params, "apiKey": key})
+    if _AUTH_STYLE == "header":
+        return [header]
+    if _AUTH_STYLE == "param":
+        return [param]
+    return [header, param]
+
+async def _remember_auth_style(style: str) -> None:
+    global _AUTH_STYLE
+    async with _AUTH_LOCK:
+        if _AUTH_STYLE is None:
+            _AUTH_STYLE = style
+
 async def _get_json(url: str, params: Dict[str, Any]) -> Any:
     key = PF_API_KEY
     if not key:
         raise RuntimeError("PF_API_KEY not set")
-    attempts = [
-        ({"accept": "application/json", "X-Api-Key": key}, params),
-        ({"accept": "application/json"}, {**params, "apiKey": key}),
-    ]
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        last_err = None
-        for headers, q in attempts:
-            try:
-                r = await client.get(url, headers=headers, params=q)
-                if r.status_code == 200:
-                    j = r.json()
-                    if isinstance(j, dict) and "payLoad" in j:
-                        return j["payLoad"]
-                    return j
-                if r.status_code in (401, 403):
-                    last_err = f"{r.status_code} {r.text[:220]}"
-                    continue
-                r.raise_for_status()
-            except Exception as e:
-                last_err = str(e)
-        raise httpx.HTTPStatusError(f"PF JSON failed for {url}: {last_err}", request=None, response=None)
+    last_err = None
+    for style, headers, q in _auth_attempts("application/json", key, params):
+        try:
+            r = await _pf_get(url, headers, q)
+            if r.status_code == 200:
+                await _remember_auth_style(style)
+                j = r.json()
+                if isinstance(j, dict) and "payLoad" in j:
+                    return j["payLoad"]
+                return j
+            if r.status_code in (401, 403):
+                last_err = f"{r.status_code} {r.text[:220]}"
+                continue
+            r.raise_for_status()
+        except Exception as e:
+            last_err = str(e)
+    raise httpx.HTTPStatusError(f"PF JSON failed for {url}: {last_err}", request=None, response=None)
 
-async def _get_csv(url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def _get_csv_bytes(url: str, params: Dict[str, Any]) -> bytes:
+    """Fetch a CSV body as raw bytes; b'' on auth/error (normal flow \u2014 debug route has the raw fetch)."""
     key = PF_API_KEY
     if not key:
         raise RuntimeError("PF_API_KEY not set")
-    attempts = [
-        ({"accept": "text/csv", "X-Api-Key": key}, params),
-        ({"accept": "text/csv"}, {**params, "apiKey": key}),
-    ]
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        last_err = None
-        for headers, q in attempts:
-            try:
-                r = await client.get(url, headers=headers, params=q)
-                if r.status_code == 200:
-                    text = r.text or ""
-                    if not text.strip():
-                        return []
-                    buff = io.StringIO(text.strip("\ufeff\r\n"))
-                    return [dict(row) for row in csv.DictReader(buff)]
-                if r.status_code in (401, 403):
-                    # return [] silently, but record error for debug path
-                    last_err = f"{r.status_code} {r.text[:220]}"
-                    continue
-                r.raise_for_status()
-            except Exception as e:
-                last_err = str(e)
-        # CSV paths: return empty list (normal flow). Debug route uses raw fetch below.
+    last_err = None
+    for style, headers, q in _auth_attempts("text/csv", key, params):
+        try:
+            r = await _pf_get(url, headers, q)
+            if r.status_code == 200:
+                await _remember_auth_style(style)
+                return r.content
+            if r.status_code in (401, 403):
+                last_err = f"{r.status_code} {r.text[:220]}"
+                continue
+            r.raise_for_status()
+        except Exception as e:
+            last_err = str(e)
+    return b""
+
+def _csv_stream(body: bytes) -> io.TextIOWrapper:
+    # utf-8-sig swallows the BOM during decode and TextIOWrapper reads straight
+    # off the response bytes \u2014 no .text str copy, no StringIO copy.
+    return io.TextIOWrapper(io.BytesIO(body), encoding="utf-8-sig", newline="")
+
+async def _get_csv(url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    body = await _get_csv_bytes(url, params)
+    if not body.strip():
         return []
+    return [dict(row) for row in csv.DictReader(_csv_stream(body))]
 
 async def _get_csv_raw(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Raw fetch for debug: expose status/body so we can see auth errors or headers."""
@@ -201,31 +268,35 @@ async def _get_csv_raw(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         ({"accept": "text/csv", "X-Api-Key": key}, params),
         ({"accept": "text/csv"}, {**params, "apiKey": key}),
     ]
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        results = []
-        for headers, q in attempts:
-            r = await client.get(url, headers=headers, params=q)
-            results.append({
-                "attempt_headers": list(headers.keys()),
-                "status_code": r.status_code,
-                "preview": (r.text[:400] if r.text else ""),
-            })
-            if r.status_code == 200:
-                # show first columns from header row
-                try:
-                    buff = io.StringIO(r.text.strip("\ufeff\r\n"))
-                    reader = csv.DictReader(buff)
-                    first = next(reader, None)
-                    cols = reader.fieldnames or []
-                    return {"ok": True, "status_code": 200, "columns": cols, "first_row": first}
-                except Exception as e:
-                    return {"ok": False, "error": f"CSV parse error: {e}", "status_code": 200}
-        return {"ok": False, "tries": results}
+    results = []
+    for headers, q in attempts:
+        r = await _pf_get(url, headers, q)
+        results.append({
+            "attempt_headers": list(headers.keys()),
+            "status_code": r.status_code,
+            "preview": (r.text[:400] if r.text else ""),
+        })
+        if r.status_code == 200:
+            # show first columns from header row
+            try:
+                buff = io.StringIO(r.text.strip("\ufeff\r\n"))
+                reader = csv.DictReader(buff)
+                first = next(reader, None)
+                cols = reader.fieldnames or []
+                return {"ok": True, "status_code": 200, "columns": cols, "first_row": first}
+            except Exception as e:
+                return {"ok": False, "error": f"CSV parse error: {e}", "status_code": 200}
+    return {"ok": False, "tries": results}
 
 # ---------------- meeting discovery ----------------
 
+# Index into the param-variant list below that first returned rows. Most PF
+# installs only speak one format; once learned, skip the other four probes.
+_MEETING_PARAM_IDX: Optional[int] = None
+
 async def _meetings_from_meeting_csv(date_str: str) -> List[Dict[str, Any]]:
     """Try multiple param names/formats to get meetings for the date."""
+    global _MEETING_PARAM_IDX
     ymd = date_str  # 'YYYY-MM-DD'
     dmy = datetime.strptime(date_str, "%Y-%m-%d").strftime("%d-%m-%Y")
 
@@ -236,20 +307,56 @@ async def _meetings_from_meeting_csv(date_str: str) -> List[Dict[str, Any]]:
         {"meetingDate": dmy},
         {"date": dmy},
     ]
-    seen = set()
-    out: List[Dict[str, Any]] = []
-    for q in tries:
-        rows = await _get_csv(PF_MEETING_CSV_URL, q)
+
+    if _MEETING_PARAM_IDX is not None:
+        rows_list = [await _get_csv(PF_MEETING_CSV_URL, tries[_MEETING_PARAM_IDX])]
+    else:
+        # Probe every variant concurrently; keep the first (in try-order) that
+        # returns rows, remember it, and cancel the stragglers.
+        tasks = [asyncio.create_task(_get_csv(PF_MEETING_CSV_URL, q)) for q in tries]
+        rows_list: List[List[Dict[str, Any]]] = []
+        try:
+            pending = set(tasks)
+            while pending and not rows_list:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for i, t in enumerate(tasks):
+                    if t.done() and not t.cancelled() and t.exception() is None and t.result():
+                        _MEETING_PARAM_IDX = i
+                        rows_list = [t.result()]
+                        break
+        finally:
+            for t in tasks:
+                t.cancel()
+
+    # Tuple keys hash in C without the f-string allocation (and can't be
+    # confused by a separator character appearing in a venue name).
+    by_key: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    race_nos: Dict[Tuple[int, str], Set[int]] = {}
+    for rows in rows_list:
         for raw in rows or []:
             c = _canonise(raw)
             mid = _parse_int(c.get("meeting_id"))
             venue = c.get("venue") or c.get("track") or c.get("course") or c.get("meeting")
-            key = f"{mid or 0}|{(venue or '').lower()}"
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append({"meeting_id": mid, "meeting": venue})
-    return out
+            key = (mid or 0, (venue or "").lower())
+            m = by_key.get(key)
+            if m is None:
+                m = by_key[key] = {"meeting_id": mid, "meeting": venue, "track_name": None, "race_count": None}
+            track = c.get("track_name")
+            if isinstance(track, str) and track.strip() and not m["track_name"]:
+                m["track_name"] = track.strip()
+            # Race count: either an explicit column, or (for per-race payloads)
+            # inferred below from the race numbers we saw for this meeting.
+            rc = _parse_int(c.get("race_count") or c.get("races") or c.get("num_races"))
+            if rc and not m["race_count"]:
+                m["race_count"] = rc
+            rno = _parse_int(c.get("race_number"))
+            if rno:
+                race_nos.setdefault(key, set()).add(rno)
+
+    for key, m in by_key.items():
+        if not m["race_count"] and key in race_nos:
+            m["race_count"] = max(race_nos[key])
+    return list(by_key.values())
 
 async def _meetings_from_updates(date_str: str) -> List[Dict[str, Any]]:
     """Use Updates endpoints (scratchings + conditions) to harvest meetingIds for that date."""
@@ -258,8 +365,13 @@ async def _meetings_from_updates(date_str: str) -> List[Dict[str, Any]]:
 
     out: Dict[int, Dict[str, Any]] = {}
 
+    # Scratchings + conditions are independent calls
+    scr, cond = await asyncio.gather(
+        _get_json(PF_UPD_SCR_URL, {}),
+        _get_json(PF_UPD_COND_URL, {}),
+    )
+
     # Scratchings
-    scr = await _get_json(PF_UPD_SCR_URL, {})
     for item in scr or []:
         c = _canonise(item)
         mdate = _yyyy_mm_dd(c.get("meeting_date") or c.get("meetingdate") or c.get("meetingdateutc") or c.get("timestamp"))
@@ -270,10 +382,9 @@ async def _meetings_from_updates(date_str: str) -> List[Dict[str, Any]]:
         mid = _parse_int(c.get("meeting_id")) or _parse_int(c.get("meetingid"))
         venue = c.get("track") or c.get("venue")
         if mid:
-            out.setdefault(mid, {"meeting_id": mid, "meeting": venue})
+            out.setdefault(mid, {"meeting_id": mid, "meeting": venue, "track_name": None, "race_count": None})
 
     # Conditions
-    cond = await _get_json(PF_UPD_COND_URL, {})
     for item in cond or []:
         c = _canonise(item)
         mdate = _yyyy_mm_dd(c.get("meeting_date") or c.get("meetingdate") or c.get("last_update") or c.get("timestamp"))
@@ -284,20 +395,22 @@ async def _meetings_from_updates(date_str: str) -> List[Dict[str, Any]]:
         mid = _parse_int(c.get("meeting_id")) or _parse_int(c.get("meetingid"))
         venue = c.get("track") or c.get("venue")
         if mid:
-            out.setdefault(mid, {"meeting_id": mid, "meeting": venue})
+            out.setdefault(mid, {"meeting_id": mid, "meeting": venue, "track_name": None, "race_count": None})
 
     return list(out.values())
 
 async def _meetings_for_date(date_str: str) -> List[Dict[str, Any]]:
     """Union of meetings from meeting CSV and Updates (deduped)."""
-    a = await _meetings_from_meeting_csv(date_str)
-    b = await _meetings_from_updates(date_str)
+    a, b = await asyncio.gather(
+        _meetings_from_meeting_csv(date_str),
+        _meetings_from_updates(date_str),
+    )
     seen = set()
     out: List[Dict[str, Any]] = []
     for m in (a + b):
         mid = m.get("meeting_id")
         venue = m.get("meeting")
-        key = f"{mid or 0}|{(venue or '').lower()}"
+        key = (mid or 0, (venue or "").lower())
         if key in seen:
             continue
         seen.add(key)
@@ -306,53 +419,103 @@ async def _meetings_for_date(date_str: str) -> List[Dict[str, Any]]:
 
 # ---------------- gear extraction ----------------
 
-async def _gear_from_meeting_csv(meeting_id: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+def _parse_form_csv(body: bytes) -> Tuple[int, List[Tuple[Optional[int], Optional[str], Optional[int], str]]]:
+    """
+    Lean parse of a form/form/csv body with csv.reader: resolve the handful of
+    columns we care about once from the header, then index straight into each
+    row — no per-row dict, no _canonise.
+    Returns (data_row_count, rows) where each row is
+    (runner_number, horse_name, runner_id, gear_change) for unscratched
+    runners that actually have a gear change.
+    """
+    if not body.strip():
+        return 0, []
+    reader = csv.reader(_csv_stream(body))
+    header = next(reader, None)
+    if not header:
+        return 0, []
+
+    col_idx: Dict[str, int] = {}
+    for i, col in enumerate(header):
+        canon = CANONICAL_KEY_MAP.get(_snakify(col))
+        if canon and canon not in col_idx:
+            col_idx[canon] = i
+    gear_i = col_idx.get("gear_change")
+    num_i  = col_idx.get("runner_number")
+    name_i = col_idx.get("horse_name")
+    rid_i  = col_idx.get("runner_id")
+    scr_i  = col_idx.get("scratched")
+
+    def _cell(row: List[str], i: Optional[int]) -> Optional[str]:
+        return row[i] if i is not None and i < len(row) else None
+
+    n_rows = 0
+    out: List[Tuple[Optional[int], Optional[str], Optional[int], str]] = []
+    for row in reader:
+        n_rows += 1
+
+        # Only take top-level GearChanges (ignore historical Forms[n].GearChanges)
+        gear = _cell(row, gear_i)
+        if not gear or not gear.strip():
+            continue
+
+        scr = _cell(row, scr_i)
+        if scr and scr.strip().lower() in {"1", "true", "y", "yes", "t"}:
+            continue
+
+        num = _cell(row, num_i)
+        try:
+            runner_no = int(num.strip()) if num and num.strip() else None
+            runner_no = runner_no if runner_no else None
+        except Exception:
+            runner_no = None
+
+        name = _cell(row, name_i)
+        out.append((
+            runner_no,
+            name.strip() if name and name.strip() else None,
+            _parse_int(_cell(row, rid_i)),
+            gear.strip(),
+        ))
+    return n_rows, out
+
+async def _gear_from_meeting_csv(meeting_id: int, race_count: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Query PF form/form/csv per raceNumber so we (a) know the race_number,
     (b) only extract current-race GearChanges (NOT Forms[n].GearChanges).
-    Returns (rows, meeting_name)
+    If the meeting CSV told us the race count, fetch exactly that many races;
+    otherwise probe 1..15 and stop at consecutive empty races.
+    The meeting/track name comes from the meeting CSV payload upstream, so we
+    no longer rediscover it here.
     """
     all_rows: List[Dict[str, Any]] = []
-    meeting_name: Optional[str] = None
 
-    # Reasonable upper bound; we break when we hit consecutive empty races.
+    upper = race_count if race_count and 0 < race_count <= 15 else 15
+    bodies = await asyncio.gather(
+        *[_get_csv_bytes(PF_FORM_CSV_URL, {"meetingId": meeting_id, "raceNumber": rn})
+          for rn in range(1, upper + 1)]
+    )
     consecutive_empty = 0
-    for rn in range(1, 16):
-        rows = await _get_csv(PF_FORM_CSV_URL, {"meetingId": meeting_id, "raceNumber": rn})
-        if not rows:
+    for rn, body in zip(range(1, upper + 1), bodies):
+        n_rows, parsed = _parse_form_csv(body)
+        if not n_rows:
             consecutive_empty += 1
-            if consecutive_empty >= 2:
+            if race_count is None and consecutive_empty >= 2:
                 break
             continue
         consecutive_empty = 0
 
-        # Cache meeting name if we can
-        if meeting_name is None:
-            meeting_name = _first_track_name(rows) or meeting_name
-
-        for raw in rows:
-            c = _canonise(raw)
-
-            # Only take top-level GearChanges for this race (ignore historical Forms[n].GearChanges)
-            gear = c.get("gearchanges")
-            if not isinstance(gear, str) or not gear.strip():
-                continue
-
-            # Skip scratched
-            if _is_scratched(c):
-                continue
-
+        for runner_no, name, runner_id, gear in parsed:
             all_rows.append({
                 "race_number": rn,
-                "runner_number": _runner_number(c),
-                "horse_name": _horse_name(c),
-                "runner_id": _parse_int(c.get("runner_id")),
-                "gear_change": gear.strip(),
+                "runner_number": runner_no,
+                "horse_name": name,
+                "runner_id": runner_id,
+                "gear_change": gear,
             })
 
     # Keep only entries with some identity
-    all_rows = [r for r in all_rows if r.get("horse_name") or r.get("runner_id")]
-    return all_rows, meeting_name
+    return [r for r in all_rows if r.get("horse_name") or r.get("runner_id")]
 
 # ---------------- debug helpers (exported) ----------------
 
@@ -370,6 +533,12 @@ async def fetch_gear_for_date(date_str: str) -> Dict[str, Any]:
     meetings = await _meetings_for_date(date_str)
     out_meetings: List[Dict[str, Any]] = []
 
+    # All meetings are independent — fetch them concurrently.
+    fetched = iter(await asyncio.gather(
+        *[_gear_from_meeting_csv(m["meeting_id"], m.get("race_count"))
+          for m in meetings if m.get("meeting_id")]
+    ))
+
     for m in meetings:
         mid = m.get("meeting_id")
         venue = m.get("meeting")
@@ -377,30 +546,33 @@ async def fetch_gear_for_date(date_str: str) -> Dict[str, Any]:
             out_meetings.append({"meeting_id": None, "meeting": venue, "races": []})
             continue
 
-        rows, track_name = await _gear_from_meeting_csv(mid)
-        # Prefer CSV track name if present
-        meeting_label = track_name or venue
-
-        # Group rows by race_number
-        races_map: Dict[int, List[Dict[str, Any]]] = {}
-        for r in rows:
-            rno = r.get("race_number")
+        rows = next(fetched)
+        # Prefer the meeting-CSV track name if present
+        meeting_label = m.get("track_name") or venue
+
+        # Rows come out of _gear_from_meeting_csv already ordered by race_number
+        # (races are fetched 1..N), so a single groupby pass replaces the
+        # intermediate dict and the extra sort over race numbers.
+        # Decorate-sort-undecorate within each race: compute each runner's sort
+        # key once instead of per comparison, via C-implemented itemgetter.
+        races_out = []
+        for rno, group in groupby(rows, key=itemgetter("race_number")):
             if rno is None:
                 continue
-            races_map.setdefault(rno, []).append({
-                "runner_number": r.get("runner_number"),
-                "horse_name": r.get("horse_name"),
-                "runner_id": r.get("runner_id"),
-                "gear_change": r.get("gear_change"),
-            })
-
-        races_out = [
-            {
-                "race_number": rno,
-                "runners": sorted(rows, key=lambda x: (x["runner_number"] is None, x["runner_number"] or 0, (x["horse_name"] or "").lower()))
-            }
-            for rno, rows in sorted(races_map.items(), key=lambda kv: kv[0])
-        ]
+            keyed = [
+                (
+                    (r["runner_number"] is None, r["runner_number"] or 0, (r["horse_name"] or "").lower()),
+                    {
+                        "runner_number": r["runner_number"],
+                        "horse_name": r["horse_name"],
+                        "runner_id": r["runner_id"],
+                        "gear_change": r["gear_change"],
+                    },
+                )
+                for r in group
+            ]
+            keyed.sort(key=itemgetter(0))
+            races_out.append({"race_number": rno, "runners": [r for _, r in keyed]})
 
         out_meetings.append({
             "meeting_id": mid,